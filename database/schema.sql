@@ -65,6 +65,10 @@ CREATE INDEX idx_api_keys_key_hash ON api_keys(key_hash);
 CREATE INDEX idx_api_keys_is_active ON api_keys(is_active);
 CREATE INDEX idx_api_keys_expires_at ON api_keys(expires_at);
 
+-- Partial index for the hot auth lookup (live keys only)
+CREATE INDEX idx_api_keys_active ON api_keys(key_hash)
+    WHERE is_active AND revoked_at IS NULL;
+
 -- ============================================================================
 -- AUDIT LOGS TABLE
 -- ============================================================================
@@ -112,6 +116,10 @@ CREATE INDEX idx_audit_logs_outcome ON audit_logs(outcome);
 CREATE INDEX idx_audit_logs_created_at ON audit_logs(created_at DESC);
 CREATE INDEX idx_audit_logs_integrity_hash ON audit_logs(integrity_hash);
 
+-- Partial index for failure alerting queries (failures are rare)
+CREATE INDEX idx_audit_logs_failures ON audit_logs(created_at)
+    WHERE outcome = 'failure';
+
 -- ============================================================================
 -- WORKFLOW EXECUTIONS TABLE
 -- ============================================================================
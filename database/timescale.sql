@@ -0,0 +1,58 @@
+-- ============================================================================
+-- AIWF SustainBot TimescaleDB Migration (optional)
+-- ============================================================================
+--
+-- Purpose: Convert governance_metrics into a TimescaleDB hypertable for
+--          time-partitioned storage.
+--
+-- Benefits:
+--   - Recent-window queries prune to the relevant chunks (O(1) instead of
+--     scanning an unbounded btree)
+--   - Columnar compression after 7 days (~5-10x storage reduction)
+--   - Retention becomes a cheap chunk drop instead of bulk DELETE
+--
+-- Requires the timescaledb extension. Safe to skip entirely: the plain
+-- table from schema.sql keeps working without it.
+--
+-- Note: audit_logs is NOT converted. workflow_executions holds a foreign
+-- key into audit_logs(id), and TimescaleDB does not support foreign keys
+-- referencing a hypertable. audit_logs retention relies on the
+-- created_at index instead.
+--
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS timescaledb;
+
+-- Hypertables require the partition column in every unique constraint,
+-- so the surrogate primary key becomes (id, timestamp). No other table
+-- references governance_metrics.
+ALTER TABLE governance_metrics DROP CONSTRAINT IF EXISTS governance_metrics_pkey;
+ALTER TABLE governance_metrics ADD PRIMARY KEY (id, timestamp);
+
+SELECT create_hypertable(
+    'governance_metrics',
+    'timestamp',
+    chunk_time_interval => INTERVAL '1 day',
+    migrate_data => TRUE,
+    if_not_exists => TRUE
+);
+
+-- Compress chunks older than 7 days, segmented by the common query keys
+ALTER TABLE governance_metrics SET (
+    timescaledb.compress,
+    timescaledb.compress_segmentby = 'metric_name, drag_mode',
+    timescaledb.compress_orderby = 'timestamp DESC'
+);
+
+SELECT add_compression_policy(
+    'governance_metrics',
+    INTERVAL '7 days',
+    if_not_exists => TRUE
+);
+
+-- Keep 90 days of raw metrics (OTS retention minimum)
+SELECT add_retention_policy(
+    'governance_metrics',
+    INTERVAL '90 days',
+    if_not_exists => TRUE
+);
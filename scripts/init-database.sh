@@ -112,6 +112,21 @@ psql "$DATABASE_URL" -f "$SCHEMA_FILE" &>/dev/null
 
 log_success "Schema created successfully"
 
+# ============================================================================
+# STEP 4b: TimescaleDB Migration (optional)
+# ============================================================================
+
+log_info "Checking for TimescaleDB extension..."
+
+TIMESCALE_AVAILABLE=$(psql "$DATABASE_URL" -t -c "SELECT count(*) FROM pg_available_extensions WHERE name = 'timescaledb';" | xargs)
+
+if [ "$TIMESCALE_AVAILABLE" = "1" ]; then
+    psql "$DATABASE_URL" -f "$PROJECT_ROOT/database/timescale.sql" &>/dev/null
+    log_success "governance_metrics converted to TimescaleDB hypertable"
+else
+    log_warning "TimescaleDB not available - governance_metrics stays unpartitioned"
+fi
+
 # ============================================================================
 # STEP 5: Verify Tables Created
 # ============================================================================
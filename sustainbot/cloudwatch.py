@@ -15,48 +15,289 @@ Metrics Published:
 """
 
 import os
+import sys
+import time
+import atexit
 import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Dict, List
-from datetime import datetime
+from datetime import datetime, timezone
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Known governance enum values, interned so dimension dicts and the
+# lru_cache keys below hash against shared string objects. Arbitrary
+# caller strings are deliberately not interned (the intern table is
+# never freed), they just pass through unchanged.
+_INTERNED = {
+    value: sys.intern(value)
+    for value in (
+        'draft', 'research', 'grunt', 'execute',   # DRAG modes
+        'success', 'failure', 'rejected',          # outcomes
+        'user', 'admin', 'sre', 'developer', 'auditor'  # actor roles
+    )
+}
+
+# FailureReason dimension values are capped at 50 chars
+_REASON_SLICE = slice(0, 50)
+
+
+def _intern(value: str) -> str:
+    """Return the shared object for known enum values, else the input"""
+    cached = _INTERNED.get(value)
+    return cached if cached is not None else value
+
+
+@lru_cache(maxsize=1024)
+def _dimensions(*pairs: tuple) -> List[Dict[str, str]]:
+    """
+    Build (and intern) a CloudWatch dimension list from (Name, Value)
+    pairs.
+
+    Dimension combinations are low-cardinality (DRAG mode x role x
+    workflow), so the record_* helpers share one list per combination
+    instead of allocating fresh dicts per metric. Callers must treat the
+    returned list as immutable.
+    """
+    return [{'Name': name, 'Value': value} for name, value in pairs]
+
+# CloudWatch PutMetricData accepts up to 1000 datums per request
+METRIC_BATCH_SIZE = 1000
+
+# How often the background flusher drains the metric buffer
+FLUSH_INTERVAL_SECONDS = float(os.getenv('CLOUDWATCH_FLUSH_INTERVAL', '5'))
+
+# Bound on buffered datums; producers drop (and count) beyond this
+BUFFER_CAPACITY = int(os.getenv('CLOUDWATCH_BUFFER_CAPACITY', '65536'))
+
+# CloudWatch Logs PutLogEvents limits: 10,000 events / 1,048,576 bytes
+# per call (900 KB leaves headroom for the 26-byte per-event overhead)
+LOG_BATCH_MAX_EVENTS = 10000
+LOG_BATCH_MAX_BYTES = 900 * 1024
+
+# GetMetricData accepts up to 500 queries per request
+METRIC_QUERY_BATCH_SIZE = 500
+
+# Flush worker pool size and bound on in-flight batches; beyond the
+# bound, batches are dropped (telemetry is best-effort) rather than
+# letting a slow CloudWatch endpoint back up the process
+FLUSH_POOL_WORKERS = int(os.getenv('CLOUDWATCH_FLUSH_WORKERS', '4'))
+FLUSH_MAX_PENDING = int(os.getenv('CLOUDWATCH_FLUSH_MAX_PENDING', '100'))
+
+# How long cached ListMetrics results stay valid
+LIST_METRICS_CACHE_TTL = float(os.getenv('CLOUDWATCH_LIST_METRICS_TTL', '300'))
+
 
 class CloudWatchPublisher:
     """Publish metrics and logs to AWS CloudWatch"""
-    
+
+    __slots__ = (
+        'namespace', 'region', 'enabled', 'cloudwatch', 'logs',
+        '_metric_buffer', '_stop_event', '_flusher_thread',
+        '_flush_pool', '_pending_flushes',
+        'metrics_buffered', 'metrics_dropped', 'batches_sent', 'batch_failures',
+        '_known_groups', '_known_streams', '_known_lock',
+        '_log_buffer', '_log_lock',
+        'events_buffered', 'log_batches_sent', 'log_batch_failures',
+        '_list_metrics_cache'
+    )
+
     def __init__(
         self,
         namespace: str = 'AIWF/SustainBot',
         region: str = 'eu-west-1',
-        enabled: bool = True
+        enabled: bool = True,
+        botocore_config: Optional[Config] = None,
+        cw_client=None,
+        logs_client=None
     ):
         """
         Initialize CloudWatch publisher.
-        
+
         Args:
             namespace: CloudWatch namespace for metrics
             region: AWS region
             enabled: Enable/disable CloudWatch publishing
+            botocore_config: Override the default botocore Config
+            cw_client: Pre-built CloudWatch client (dependency injection)
+            logs_client: Pre-built CloudWatch Logs client (dependency injection)
         """
         self.namespace = namespace
         self.region = region
         self.enabled = enabled
-        
+
+        # Metric batching state (flushed by a background thread).
+        # deque.append/popleft are atomic in CPython, so producers enqueue
+        # lock-free (MPSC: many request threads, one flusher).
+        self._metric_buffer = deque()
+        self._stop_event = threading.Event()
+        self._flusher_thread: Optional[threading.Thread] = None
+        self._flush_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_flushes = threading.BoundedSemaphore(FLUSH_MAX_PENDING)
+
+        # Publishing counters (writes/drops/failures)
+        self.metrics_buffered = 0
+        self.metrics_dropped = 0
+        self.batches_sent = 0
+        self.batch_failures = 0
+
+        # Log groups/streams already confirmed to exist, so steady-state
+        # put_log_event skips the create_log_group/create_log_stream calls
+        self._known_groups: set = set()
+        self._known_streams: set = set()
+        self._known_lock = threading.Lock()
+
+        # Log event batching: events accumulate per (group, stream) in the
+        # active buffer; the flusher swaps in a fresh dict and drains the
+        # old one so producers are never blocked on network I/O
+        self._log_buffer: Dict[tuple, list] = {}
+        self._log_lock = threading.Lock()
+        self.events_buffered = 0
+        self.log_batches_sent = 0
+        self.log_batch_failures = 0
+
+        # ListMetrics cache: namespace -> (monotonic expiry, metric list)
+        self._list_metrics_cache: Dict[str, tuple] = {}
+
         if self.enabled:
             try:
-                self.cloudwatch = boto3.client('cloudwatch', region_name=region)
-                self.logs = boto3.client('logs', region_name=region)
+                # Tight timeouts, adaptive retries, and a pooled connection
+                # limit shared by both clients (the boto3 defaults allow a
+                # 60s socket read and no pool tuning, which exhausts sockets
+                # under concurrent flushes)
+                config = botocore_config or Config(
+                    connect_timeout=3,
+                    read_timeout=10,
+                    retries={'max_attempts': 5, 'mode': 'adaptive'},
+                    max_pool_connections=50
+                )
+                self.cloudwatch = cw_client or boto3.client(
+                    'cloudwatch', region_name=region, config=config
+                )
+                self.logs = logs_client or boto3.client(
+                    'logs', region_name=region, config=config
+                )
                 logger.info(f"CloudWatch integration enabled (namespace: {namespace}, region: {region})")
             except Exception as e:
                 logger.warning(f"CloudWatch client initialization failed: {e}")
                 self.enabled = False
         else:
             logger.info("CloudWatch integration disabled")
-    
+
+        if self.enabled:
+            self._start_flusher()
+
+    def _start_flusher(self):
+        """Start the background metric flusher thread and send pool"""
+        self._flush_pool = ThreadPoolExecutor(
+            max_workers=FLUSH_POOL_WORKERS,
+            thread_name_prefix='cloudwatch-flush'
+        )
+        self._flusher_thread = threading.Thread(
+            target=self._flush_loop,
+            name='cloudwatch-metric-flusher',
+            daemon=True
+        )
+        self._flusher_thread.start()
+        atexit.register(self.shutdown)
+
+    def _flush_loop(self):
+        """Background loop draining the metric buffer on an interval"""
+        while not self._stop_event.wait(FLUSH_INTERVAL_SECONDS):
+            # A failed tick must not kill the daemon — there is no way to
+            # restart it, so swallow, log, and retry next interval
+            try:
+                self.flush_metrics()
+                self.flush_logs()
+            except Exception as e:
+                logger.error(f"Flush tick failed: {e}")
+
+    def flush_metrics(self):
+        """
+        Drain the metric buffer into batches of up to 1000 datums (the
+        PutMetricData maximum) and hand them to the send pool.
+
+        The network calls run on pool workers, so a slow CloudWatch
+        endpoint delays neither the flusher tick nor producers. When
+        FLUSH_MAX_PENDING batches are already in flight, further batches
+        are dropped and counted instead of queueing unboundedly.
+        """
+        while True:
+            batch = []
+            while len(batch) < METRIC_BATCH_SIZE:
+                try:
+                    batch.append(self._metric_buffer.popleft())
+                except IndexError:
+                    break
+
+            if not batch:
+                return
+
+            if not self._pending_flushes.acquire(blocking=False):
+                self.metrics_dropped += len(batch)
+                continue
+
+            if self._flush_pool is not None:
+                try:
+                    self._flush_pool.submit(self._send_metric_batch, batch)
+                except RuntimeError:
+                    # Interpreter shutdown already retired the pool's
+                    # threads; send inline rather than losing the batch
+                    self._send_metric_batch(batch)
+            else:
+                self._send_metric_batch(batch)
+
+    def _send_metric_batch(self, batch: List[Dict]):
+        """Send one PutMetricData batch (runs on a pool worker)"""
+        try:
+            # Convert raw nanosecond stamps to datetimes, shared per second
+            # (CloudWatch standard resolution) across the batch
+            ts_cache: Dict[int, datetime] = {}
+            for datum in batch:
+                seconds = datum['Timestamp'] // 1_000_000_000
+                ts = ts_cache.get(seconds)
+                if ts is None:
+                    ts = datetime.fromtimestamp(seconds, tz=timezone.utc)
+                    ts_cache[seconds] = ts
+                datum['Timestamp'] = ts
+
+            try:
+                self.cloudwatch.put_metric_data(
+                    Namespace=self.namespace,
+                    MetricData=batch
+                )
+                self.batches_sent += 1
+            except Exception as e:
+                # Connection errors are BotoCoreError, not ClientError —
+                # and an uncaught raise here vanishes into the Future
+                self.batch_failures += 1
+                logger.error(f"Failed to put metric batch ({len(batch)} datums): {e}")
+        finally:
+            self._pending_flushes.release()
+
+    def shutdown(self):
+        """Stop the flusher thread and flush any remaining metrics"""
+        self._stop_event.set()
+        if self._flusher_thread:
+            self._flusher_thread.join(timeout=FLUSH_INTERVAL_SECONDS)
+        # concurrent.futures installs its own shutdown hook via
+        # threading._register_atexit, which runs BEFORE module atexit
+        # callbacks — by the time we get here pool.submit would raise
+        # RuntimeError. Retire the pool first so the final flush below
+        # sends the remaining batches synchronously on this thread.
+        if self._flush_pool is not None:
+            pool, self._flush_pool = self._flush_pool, None
+            pool.shutdown(wait=True)
+        self.flush_metrics()
+        self.flush_logs()
+
     def put_metric(
         self,
         metric_name: str,
@@ -65,8 +306,12 @@ class CloudWatchPublisher:
         dimensions: Optional[List[Dict[str, str]]] = None
     ):
         """
-        Put a single metric to CloudWatch.
-        
+        Buffer a single metric for CloudWatch.
+
+        Metrics are batched in-process and flushed by a background thread
+        (up to 1000 datums per PutMetricData call) instead of paying one
+        HTTPS round-trip per metric.
+
         Args:
             metric_name: Name of the metric
             value: Metric value
@@ -75,24 +320,26 @@ class CloudWatchPublisher:
         """
         if not self.enabled:
             return
-        
-        try:
-            metric_data = {
-                'MetricName': metric_name,
-                'Value': value,
-                'Unit': unit,
-                'Timestamp': datetime.utcnow()
-            }
-            
-            if dimensions:
-                metric_data['Dimensions'] = dimensions
-            
-            self.cloudwatch.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=[metric_data]
-            )
-        except ClientError as e:
-            logger.error(f"Failed to put metric {metric_name}: {e}")
+
+        # Producers stamp a raw nanosecond integer; datetime construction
+        # (much slower than time.time_ns) is deferred to flush time
+        metric_data = {
+            'MetricName': metric_name,
+            'Value': value,
+            'Unit': unit,
+            'Timestamp': time.time_ns()
+        }
+
+        if dimensions:
+            metric_data['Dimensions'] = dimensions
+
+        # Backpressure: drop (and count) rather than block the producer
+        if len(self._metric_buffer) >= BUFFER_CAPACITY:
+            self.metrics_dropped += 1
+            return
+
+        self._metric_buffer.append(metric_data)
+        self.metrics_buffered += 1
     
     def put_governance_metric(
         self,
@@ -112,17 +359,15 @@ class CloudWatchPublisher:
             actor_role: Actor's role (optional)
             workflow_name: Workflow name (optional)
         """
-        dimensions = [
-            {'Name': 'DRAGMode', 'Value': drag_mode}
-        ]
-        
+        pairs = [('DRAGMode', _intern(drag_mode))]
+
         if actor_role:
-            dimensions.append({'Name': 'ActorRole', 'Value': actor_role})
-        
+            pairs.append(('ActorRole', _intern(actor_role)))
+
         if workflow_name:
-            dimensions.append({'Name': 'WorkflowName', 'Value': workflow_name})
-        
-        self.put_metric(metric_name, value, unit='Count', dimensions=dimensions)
+            pairs.append(('WorkflowName', workflow_name))
+
+        self.put_metric(metric_name, value, unit='Count', dimensions=_dimensions(*pairs))
     
     def record_aim_request(self, drag_mode: str, actor_role: str, workflow_name: str):
         """Record AIM-declared governance request"""
@@ -140,10 +385,10 @@ class CloudWatchPublisher:
             metric_name='AIMValidationFailures',
             value=1.0,
             unit='Count',
-            dimensions=[
-                {'Name': 'FailureReason', 'Value': failure_reason[:50]},
-                {'Name': 'DRAGMode', 'Value': drag_mode}
-            ]
+            dimensions=_dimensions(
+                ('FailureReason', failure_reason[_REASON_SLICE]),
+                ('DRAGMode', _intern(drag_mode))
+            )
         )
     
     def record_workflow_execution(
@@ -154,14 +399,13 @@ class CloudWatchPublisher:
         drag_mode: str = None
     ):
         """Record workflow execution"""
-        dimensions = [
-            {'Name': 'WorkflowName', 'Value': workflow_name},
-            {'Name': 'Outcome', 'Value': outcome}
-        ]
-        
+        pairs = [('WorkflowName', workflow_name), ('Outcome', _intern(outcome))]
+
         if drag_mode:
-            dimensions.append({'Name': 'DRAGMode', 'Value': drag_mode})
-        
+            pairs.append(('DRAGMode', _intern(drag_mode)))
+
+        dimensions = _dimensions(*pairs)
+
         # Count metric
         self.put_metric(
             metric_name='WorkflowExecutions',
@@ -184,12 +428,42 @@ class CloudWatchPublisher:
             metric_name='AuditLogEntries',
             value=1.0,
             unit='Count',
-            dimensions=[
-                {'Name': 'Outcome', 'Value': outcome},
-                {'Name': 'DRAGMode', 'Value': drag_mode}
-            ]
+            dimensions=_dimensions(
+                ('Outcome', _intern(outcome)),
+                ('DRAGMode', _intern(drag_mode))
+            )
         )
     
+    def _ensure_log_destination(self, log_group: str, log_stream: str):
+        """
+        Create the log group/stream on first use only.
+
+        Previously every put_log_event paid two extra CloudWatch Logs
+        round-trips re-creating resources that already existed; known
+        destinations are cached for the lifetime of the publisher.
+        """
+        if log_group not in self._known_groups:
+            with self._known_lock:
+                if log_group not in self._known_groups:
+                    try:
+                        self.logs.create_log_group(logGroupName=log_group)
+                    except self.logs.exceptions.ResourceAlreadyExistsException:
+                        pass
+                    self._known_groups.add(log_group)
+
+        stream_key = (log_group, log_stream)
+        if stream_key not in self._known_streams:
+            with self._known_lock:
+                if stream_key not in self._known_streams:
+                    try:
+                        self.logs.create_log_stream(
+                            logGroupName=log_group,
+                            logStreamName=log_stream
+                        )
+                    except self.logs.exceptions.ResourceAlreadyExistsException:
+                        pass
+                    self._known_streams.add(stream_key)
+
     def put_log_event(
         self,
         log_group: str,
@@ -198,8 +472,12 @@ class CloudWatchPublisher:
         timestamp: Optional[datetime] = None
     ):
         """
-        Put log event to CloudWatch Logs.
-        
+        Buffer a log event for CloudWatch Logs.
+
+        Events are batched per (group, stream) and flushed by the
+        background thread (up to 10,000 events / ~1 MiB per PutLogEvents
+        call) instead of one synchronous call per message.
+
         Args:
             log_group: CloudWatch log group name
             log_stream: CloudWatch log stream name
@@ -208,57 +486,175 @@ class CloudWatchPublisher:
         """
         if not self.enabled:
             return
-        
-        try:
-            # Ensure log group exists
+
+        if timestamp is not None:
+            timestamp_ms = int(timestamp.timestamp() * 1000)
+        else:
+            timestamp_ms = time.time_ns() // 1_000_000
+        event = {'timestamp': timestamp_ms, 'message': message}
+
+        with self._log_lock:
+            buffer = self._log_buffer.setdefault((log_group, log_stream), [])
+            buffer.append(event)
+            full = len(buffer) >= LOG_BATCH_MAX_EVENTS
+        self.events_buffered += 1
+
+        # Oversized buffers flush inline rather than waiting for the tick
+        if full:
+            self.flush_logs()
+
+    def flush_logs(self):
+        """
+        Swap out the active log buffer and drain it to CloudWatch Logs.
+
+        Each (group, stream) batch is sorted by timestamp (the API
+        requires chronological order) and sent in API-limit-sized chunks.
+        """
+        with self._log_lock:
+            if not self._log_buffer:
+                return
+            buffers, self._log_buffer = self._log_buffer, {}
+
+        for (log_group, log_stream), events in buffers.items():
             try:
-                self.logs.create_log_group(logGroupName=log_group)
-            except self.logs.exceptions.ResourceAlreadyExistsException:
-                pass
-            
-            # Ensure log stream exists
+                self._ensure_log_destination(log_group, log_stream)
+                events.sort(key=lambda e: e['timestamp'])
+
+                batch = []
+                batch_bytes = 0
+                for event in events:
+                    event_bytes = len(event['message']) + 26
+                    if batch and (
+                        len(batch) >= LOG_BATCH_MAX_EVENTS
+                        or batch_bytes + event_bytes > LOG_BATCH_MAX_BYTES
+                    ):
+                        self._send_log_batch(log_group, log_stream, batch)
+                        batch = []
+                        batch_bytes = 0
+                    batch.append(event)
+                    batch_bytes += event_bytes
+
+                if batch:
+                    self._send_log_batch(log_group, log_stream, batch)
+            except Exception as e:
+                # Broad on purpose: connection failures raise
+                # EndpointConnectionError and friends, which are
+                # BotoCoreError subclasses, not ClientError
+                self.log_batch_failures += 1
+                logger.error(f"Failed to flush log events for {log_group}/{log_stream}: {e}")
+
+    def _send_log_batch(self, log_group: str, log_stream: str, batch: List[Dict]):
+        """Send one PutLogEvents batch"""
+        self.logs.put_log_events(
+            logGroupName=log_group,
+            logStreamName=log_stream,
+            logEvents=batch
+        )
+        self.log_batches_sent += 1
+
+    def get_metrics_batch(
+        self,
+        queries: List[Dict],
+        start_time: datetime,
+        end_time: datetime
+    ) -> Dict[str, List]:
+        """
+        Fetch many metrics in batched GetMetricData calls.
+
+        GetMetricData takes up to 500 queries per request, so dashboard
+        reads pay one API call per 500 metrics instead of one
+        GetMetricStatistics call per metric.
+
+        Args:
+            queries: MetricDataQueries entries (each with a unique Id)
+            start_time: Start of the query window
+            end_time: End of the query window
+
+        Returns:
+            Dict mapping query Id to its MetricDataResult entries
+        """
+        if not self.enabled:
+            return {}
+
+        results: Dict[str, List] = {}
+
+        for start in range(0, len(queries), METRIC_QUERY_BATCH_SIZE):
+            chunk = queries[start:start + METRIC_QUERY_BATCH_SIZE]
             try:
-                self.logs.create_log_stream(
-                    logGroupName=log_group,
-                    logStreamName=log_stream
-                )
-            except self.logs.exceptions.ResourceAlreadyExistsException:
-                pass
-            
-            # Put log event
-            timestamp_ms = int((timestamp or datetime.utcnow()).timestamp() * 1000)
-            
-            self.logs.put_log_events(
-                logGroupName=log_group,
-                logStreamName=log_stream,
-                logEvents=[
-                    {
-                        'timestamp': timestamp_ms,
-                        'message': message
-                    }
-                ]
-            )
+                # Follow NextToken: large windows span multiple pages and a
+                # single call would silently truncate the series
+                kwargs = {
+                    'MetricDataQueries': chunk,
+                    'StartTime': start_time,
+                    'EndTime': end_time
+                }
+                while True:
+                    response = self.cloudwatch.get_metric_data(**kwargs)
+                    for result in response.get('MetricDataResults', []):
+                        results.setdefault(result['Id'], []).append(result)
+                    next_token = response.get('NextToken')
+                    if not next_token:
+                        break
+                    kwargs['NextToken'] = next_token
+            except ClientError as e:
+                logger.error(f"Failed to get metric data batch: {e}")
+
+        return results
+
+    def list_metrics(self, namespace: Optional[str] = None) -> List[Dict]:
+        """
+        List metrics in a namespace, cached for LIST_METRICS_CACHE_TTL.
+
+        ListMetrics is slow and heavily throttled; dashboard callers hit
+        it with the same namespace repeatedly, so results are reused for
+        five minutes by default.
+        """
+        if not self.enabled:
+            return []
+
+        namespace = namespace or self.namespace
+        now = time.monotonic()
+
+        cached = self._list_metrics_cache.get(namespace)
+        if cached is not None and now < cached[0]:
+            return cached[1]
+
+        metrics: List[Dict] = []
+        try:
+            paginator = self.cloudwatch.get_paginator('list_metrics')
+            for page in paginator.paginate(Namespace=namespace):
+                metrics.extend(page.get('Metrics', []))
         except ClientError as e:
-            logger.error(f"Failed to put log event: {e}")
+            logger.error(f"Failed to list metrics for {namespace}: {e}")
+            return metrics
+
+        self._list_metrics_cache[namespace] = (now + LIST_METRICS_CACHE_TTL, metrics)
+        return metrics
 
 
 # Singleton instance
 _cloudwatch_publisher: Optional[CloudWatchPublisher] = None
+_publisher_init_lock = threading.Lock()
 
 
 def get_cloudwatch_publisher() -> CloudWatchPublisher:
     """Get CloudWatch publisher singleton"""
     global _cloudwatch_publisher
-    
+
+    # Double-checked locking: the fast path is one is-None check; the
+    # lock only guards concurrent first use so two threads cannot both
+    # build clients and race the assignment
     if _cloudwatch_publisher is None:
-        namespace = os.getenv('CLOUDWATCH_NAMESPACE', 'AIWF/SustainBot')
-        region = os.getenv('CLOUDWATCH_REGION', 'eu-west-1')
-        enabled = os.getenv('CLOUDWATCH_ENABLED', 'false').lower() == 'true'
-        
-        _cloudwatch_publisher = CloudWatchPublisher(
-            namespace=namespace,
-            region=region,
-            enabled=enabled
-        )
-    
+        with _publisher_init_lock:
+            if _cloudwatch_publisher is None:
+                namespace = os.getenv('CLOUDWATCH_NAMESPACE', 'AIWF/SustainBot')
+                region = os.getenv('CLOUDWATCH_REGION', 'eu-west-1')
+                enabled = os.getenv('CLOUDWATCH_ENABLED', 'false').lower() == 'true'
+
+                _cloudwatch_publisher = CloudWatchPublisher(
+                    namespace=namespace,
+                    region=region,
+                    enabled=enabled
+                )
+
     return _cloudwatch_publisher
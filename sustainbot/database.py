@@ -6,13 +6,15 @@ session factory, and database initialization.
 """
 
 import os
+import time
 import logging
+import threading
 from contextlib import contextmanager
 from typing import Generator, Optional
 from sqlalchemy import create_engine, event, pool
-from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
-from database_models import Base
+from database_models import Base, APIKey
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +30,15 @@ POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', '10'))
 POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '30'))
 POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '3600'))  # 1 hour
 
-# Engine singleton
+# pool_pre_ping issues a SELECT 1 round-trip on every checkout; stale
+# connections are caught by TCP keepalives + pool_recycle instead, so
+# pre-ping is off unless explicitly requested
+POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'false').lower() == 'true'
+
+# Engine singleton (double-checked locking guards concurrent first use)
 _engine = None
 _session_factory = None
+_init_lock = threading.Lock()
 
 
 # ============================================================================
@@ -40,33 +48,51 @@ _session_factory = None
 def get_engine():
     """Get or create SQLAlchemy engine with connection pooling"""
     global _engine
-    
-    if _engine is None:
+
+    if _engine is not None:
+        return _engine
+
+    with _init_lock:
+        if _engine is not None:
+            return _engine
+
         logger.info(f"Creating database engine: {DATABASE_URL.split('@')[1] if '@' in DATABASE_URL else 'local'}")
-        
-        _engine = create_engine(
+
+        engine = create_engine(
             DATABASE_URL,
             poolclass=pool.QueuePool,
             pool_size=POOL_SIZE,
             max_overflow=POOL_MAX_OVERFLOW,
             pool_timeout=POOL_TIMEOUT,
             pool_recycle=POOL_RECYCLE,
-            pool_pre_ping=True,  # Verify connections before using
+            pool_pre_ping=POOL_PRE_PING,
+            connect_args={
+                'keepalives': 1,
+                'keepalives_idle': 30,
+                'keepalives_interval': 10,
+                'keepalives_count': 3
+            },
             echo=os.getenv('DB_ECHO', 'false').lower() == 'true',  # SQL logging
-            future=True  # SQLAlchemy 2.0 style
+            future=True,  # SQLAlchemy 2.0 style
+            # Batch repeated ORM INSERTs into multi-VALUES statements so the
+            # server parses/binds one statement per page instead of per row
+            insertmanyvalues_page_size=int(os.getenv('DB_INSERTMANY_PAGE_SIZE', '1000'))
         )
-        
-        # Event listeners
-        @event.listens_for(_engine, "connect")
+
+        # Event listeners (attached before publishing the singleton so no
+        # thread ever sees a half-configured engine)
+        @event.listens_for(engine, "connect")
         def receive_connect(dbapi_conn, connection_record):
             """Log new database connections"""
             logger.debug("New database connection established")
-        
-        @event.listens_for(_engine, "checkout")
+
+        @event.listens_for(engine, "checkout")
         def receive_checkout(dbapi_conn, connection_record, connection_proxy):
             """Log connection checkout from pool"""
             logger.debug("Connection checked out from pool")
-    
+
+        _engine = engine
+
     return _engine
 
 
@@ -77,19 +103,23 @@ def get_engine():
 def get_session_factory():
     """Get or create session factory"""
     global _session_factory
-    
+
     if _session_factory is None:
+        # Resolve the engine before taking the lock (get_engine acquires
+        # the same non-reentrant lock on first use)
         engine = get_engine()
-        _session_factory = scoped_session(
-            sessionmaker(
-                bind=engine,
-                autocommit=False,
-                autoflush=False,
-                expire_on_commit=False  # Prevent lazy loading issues
-            )
-        )
-        logger.info("Session factory created")
-    
+        with _init_lock:
+            if _session_factory is None:
+                _session_factory = scoped_session(
+                    sessionmaker(
+                        bind=engine,
+                        autocommit=False,
+                        autoflush=False,
+                        expire_on_commit=False  # Prevent lazy loading issues
+                    )
+                )
+                logger.info("Session factory created")
+
     return _session_factory
 
 
@@ -137,6 +167,73 @@ def session_scope() -> Generator[Session, None, None]:
         logger.debug("Session closed")
 
 
+# ============================================================================
+# API KEY RESOLUTION
+# ============================================================================
+
+# In-process cache for key_hash -> APIKey lookups. Keys are long-lived
+# (90-day expiry) and looked up on every authenticated request, so the
+# steady state should not pay a Postgres round-trip per call.
+API_KEY_CACHE_TTL = float(os.getenv('API_KEY_CACHE_TTL', '60'))
+API_KEY_CACHE_SIZE = int(os.getenv('API_KEY_CACHE_SIZE', '10000'))
+
+_api_key_cache: dict = {}
+_api_key_cache_lock = threading.Lock()
+
+
+def resolve_api_key(key_hash: str) -> Optional[APIKey]:
+    """
+    Resolve a key hash to a valid APIKey, with short-TTL caching.
+
+    Cached rows are re-checked with is_valid() on every hit, so
+    revocation and expiry take effect immediately from the cached
+    revoked_at/expires_at columns; a revoked key never needs the cache
+    entry to age out.
+
+    Args:
+        key_hash: SHA-256 hex digest of the presented API key
+
+    Returns:
+        The APIKey (with user eagerly loaded) if it exists and is
+        currently valid, otherwise None
+    """
+    now = time.monotonic()
+
+    entry = _api_key_cache.get(key_hash)
+    if entry is not None and now < entry[0]:
+        api_key = entry[1]
+        return api_key if api_key is not None and api_key.is_valid() else None
+
+    with session_scope() as session:
+        api_key = (
+            session.query(APIKey)
+            .options(joinedload(APIKey.user))
+            .filter(APIKey.key_hash == key_hash)
+            .one_or_none()
+        )
+
+    with _api_key_cache_lock:
+        if len(_api_key_cache) >= API_KEY_CACHE_SIZE:
+            _api_key_cache.clear()
+        _api_key_cache[key_hash] = (now + API_KEY_CACHE_TTL, api_key)
+
+    return api_key if api_key is not None and api_key.is_valid() else None
+
+
+def invalidate_api_key_cache(key_hash: Optional[str] = None):
+    """
+    Drop one cached API key entry, or the whole cache.
+
+    Call after revoking or deleting a key so the change is visible
+    before the TTL expires.
+    """
+    with _api_key_cache_lock:
+        if key_hash is None:
+            _api_key_cache.clear()
+        else:
+            _api_key_cache.pop(key_hash, None)
+
+
 # ============================================================================
 # DATABASE INITIALIZATION
 # ============================================================================
@@ -231,26 +328,36 @@ def close_database():
 def run_sql_file(filepath: str):
     """
     Execute SQL commands from a file.
-    
+
+    The whole script is sent to the server in a single call via the raw
+    DBAPI connection (psycopg2 passes it through one libpq PQexec), so
+    there is one round-trip instead of one per statement, and statements
+    containing semicolons in string literals or DO $$ ... $$ blocks are
+    no longer broken by client-side splitting.
+
     Args:
         filepath: Path to SQL file (e.g., database/schema.sql)
     """
     engine = get_engine()
-    
+
     try:
         with open(filepath, 'r') as f:
             sql = f.read()
-        
-        with engine.connect() as conn:
-            # Execute each statement separately
-            for statement in sql.split(';'):
-                statement = statement.strip()
-                if statement:
-                    conn.execute(statement)
-        
+
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            cursor.execute(sql)
+            raw.commit()
+        except Exception:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
         logger.info(f"SQL file executed successfully: {filepath}")
         return True
-        
+
     except Exception as e:
         logger.error(f"Failed to execute SQL file {filepath}: {e}")
         raise
@@ -18,13 +18,15 @@ DRAG (Decision Responsibilities):
 Reference: sustainnet-vision/GOVERNANCE/AIM-DRAG-FRAMEWORK.md
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from typing import List, Dict, Optional, Any
 from enum import Enum
-from datetime import datetime
+from datetime import datetime, timezone
 import hashlib
-import json
 import re
+import time
+
+import orjson
 
 
 # ============================================================================
@@ -62,11 +64,22 @@ class Actor(BaseModel):
     - Will be held accountable for outcomes
     - Has authority to approve/reject AI recommendations
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=1, description="Full name of accountable person")
     email: Optional[str] = Field(None, description="Contact email for accountability")
     role: str = Field(..., min_length=1, description="Role/title (e.g., 'DevOps Engineer', 'Product Lead')")
-    
-    @validator('email')
+
+    @field_validator('name')
+    @classmethod
+    def validate_name(cls, v):
+        """Require a real person's name, not a placeholder initial"""
+        if len(v.strip()) < 3:
+            raise ValueError("Actor name must be at least 3 characters (real person required)")
+        return v
+
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         if v and '@' not in v:
             raise ValueError("Invalid email format")
@@ -82,6 +95,8 @@ class InputSource(BaseModel):
     - {"type": "configuration", "description": "terraform.tfvars"}
     - {"type": "external_system", "description": "GitHub Actions workflow file"}
     """
+    model_config = ConfigDict(frozen=True)
+
     type: str = Field(..., description="Type of input (e.g., 'file', 'api', 'database', 'configuration')")
     description: str = Field(..., description="Human-readable description of the input")
     location: Optional[str] = Field(None, description="Path, URL, or identifier")
@@ -94,7 +109,9 @@ class Input(BaseModel):
     - sources: What data is AI allowed to use?
     - constraints: What rules must AI follow?
     """
-    sources: List[InputSource] = Field(..., min_items=1, description="Data sources AI can access")
+    model_config = ConfigDict(frozen=True)
+
+    sources: List[InputSource] = Field(..., min_length=1, description="Data sources AI can access")
     constraints: List[str] = Field(default_factory=list, description="Rules AI must follow (e.g., 'Read-only', 'No destructive ops')")
 
 
@@ -106,8 +123,10 @@ class Mission(BaseModel):
     - objective: What are we trying to achieve?
     - success_criteria: How do we know it worked?
     """
+    model_config = ConfigDict(frozen=True)
+
     objective: str = Field(..., min_length=10, description="Clear statement of what must improve")
-    success_criteria: List[str] = Field(..., min_items=1, description="Measurable success indicators")
+    success_criteria: List[str] = Field(..., min_length=1, description="Measurable success indicators")
 
 
 class AIMDeclaration(BaseModel):
@@ -135,16 +154,41 @@ class AIMDeclaration(BaseModel):
             )
         )
     """
+    model_config = ConfigDict(frozen=True)
+
     actor: Actor
     input: Input
     mission: Mission
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for logging"""
+        """
+        Convert to dictionary for logging.
+
+        Reads attributes directly instead of nested .dict() calls: these
+        are trusted server-constructed models, so the recursive Pydantic
+        serialization pass is wasted work on every audit entry.
+        """
         return {
-            "actor": self.actor.dict(),
-            "input": self.input.dict(),
-            "mission": self.mission.dict()
+            "actor": {
+                "name": self.actor.name,
+                "email": self.actor.email,
+                "role": self.actor.role
+            },
+            "input": {
+                "sources": [
+                    {
+                        "type": source.type,
+                        "description": source.description,
+                        "location": source.location
+                    }
+                    for source in self.input.sources
+                ],
+                "constraints": list(self.input.constraints)
+            },
+            "mission": {
+                "objective": self.mission.objective,
+                "success_criteria": list(self.mission.success_criteria)
+            }
         }
 
 
@@ -166,13 +210,16 @@ class GovernanceRequest(BaseModel):
             parameters={"environment": "staging", "version": "v1.2.3"}
         )
     """
+    model_config = ConfigDict(frozen=True)
+
     workflow_name: str = Field(..., description="Name of workflow to execute")
     aim: AIMDeclaration = Field(..., description="Complete AIM declaration")
     drag_mode: DRAGMode = Field(..., description="DRAG responsibility mode")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Workflow-specific parameters")
     trace_id: Optional[str] = Field(None, description="Trace ID for request tracking")
     
-    @validator('drag_mode')
+    @field_validator('drag_mode')
+    @classmethod
     def validate_drag_mode(cls, v):
         """Ensure only AI-allowed DRAG modes are used"""
         if v not in [DRAGMode.DRAFT, DRAGMode.RESEARCH, DRAGMode.GRUNT, DRAGMode.EXECUTE]:
@@ -180,11 +227,58 @@ class GovernanceRequest(BaseModel):
         return v
 
 
+# ============================================================================
+# GOVERNANCE REQUEST PARSE CACHE
+# ============================================================================
+
+# Repeated invocations often replay the same AIM declaration verbatim, and
+# pydantic validation dominates the per-request CPU cost. Cache validated
+# GovernanceRequest objects keyed by a digest of the canonical payload so
+# replays skip validation entirely.
+_PARSE_CACHE_SIZE = 1024
+
+_parse_cache: Dict[bytes, GovernanceRequest] = {}
+
+
+def parse_governance_request(data: Dict[str, Any], trace_id: Optional[str] = None) -> GovernanceRequest:
+    """
+    Construct a validated GovernanceRequest, reusing a cached instance when
+    the same payload has been seen before.
+
+    trace_id varies per request, so it is excluded from the cache key and
+    applied afterwards via a validation-free model_copy().
+
+    Args:
+        data: Raw request payload (workflow_name, aim, drag_mode, parameters)
+        trace_id: Optional per-request trace ID
+
+    Raises:
+        pydantic.ValidationError: If the payload fails validation
+    """
+    try:
+        key = hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).digest()
+    except TypeError:
+        # Non-serializable payload values; fall back to uncached validation
+        # (pydantic will produce the proper error if they are also invalid)
+        return GovernanceRequest(**data, trace_id=trace_id)
+
+    request = _parse_cache.get(key)
+    if request is None:
+        request = GovernanceRequest(**data)
+        if len(_parse_cache) >= _PARSE_CACHE_SIZE:
+            _parse_cache.clear()
+        _parse_cache[key] = request
+
+    if trace_id is not None:
+        return request.model_copy(update={'trace_id': trace_id})
+    return request
+
+
 # ============================================================================
 # PRESCRIPTIVE LANGUAGE FILTER
 # ============================================================================
 
-FORBIDDEN_PHRASES = [
+FORBIDDEN_PHRASES = (
     "you should",
     "you must",
     "the best option is",
@@ -194,9 +288,9 @@ FORBIDDEN_PHRASES = [
     "never use",
     "i recommend",
     "my recommendation is",
-]
+)
 
-ALLOWED_PHRASES = [
+ALLOWED_PHRASES = (
     "options include",
     "trade-offs are",
     "considerations include",
@@ -205,7 +299,30 @@ ALLOWED_PHRASES = [
     "another option is",
     "unknowns are",
     "risks include",
-]
+)
+
+# Compiled once at import: one alternation pass over the output replaces
+# a separate substring scan per forbidden phrase. The phrases are ASCII,
+# so IGNORECASE matches directly against the original string without
+# allocating a lowercased copy of every response.
+_FORBIDDEN_PATTERN = re.compile(
+    '|'.join(re.escape(phrase) for phrase in FORBIDDEN_PHRASES),
+    re.IGNORECASE
+)
+
+_ALLOWED_HINT = ', '.join(ALLOWED_PHRASES[:3])
+
+# Rejection messages built once per (mode, phrase) pair for the common
+# case; matches whose lowercased text isn't a key (IGNORECASE also matches
+# Unicode case-fold equivalents like 'ſ'→'s') format the message inline
+_REJECTION_MESSAGES = {
+    (mode, phrase): (
+        f"Prescriptive language detected in {mode.value} mode: '{phrase}'. "
+        f"Use neutral phrasing like: {_ALLOWED_HINT}"
+    )
+    for mode in (DRAGMode.DRAFT, DRAGMode.RESEARCH)
+    for phrase in FORBIDDEN_PHRASES
+}
 
 
 def filter_prescriptive_language(output: str, drag_mode: DRAGMode) -> tuple[bool, Optional[str]]:
@@ -228,16 +345,19 @@ def filter_prescriptive_language(output: str, drag_mode: DRAGMode) -> tuple[bool
         # More permissive for execution modes
         return True, None
     
-    output_lower = output.lower()
-    
-    # Check for forbidden phrases
-    for phrase in FORBIDDEN_PHRASES:
-        if phrase in output_lower:
-            return False, (
-                f"Prescriptive language detected in {drag_mode.value} mode: '{phrase}'. "
-                f"Use neutral phrasing like: {', '.join(ALLOWED_PHRASES[:3])}"
+    # Single case-insensitive pass over the original output; the rare
+    # rejection path is a precomputed-message lookup
+    match = _FORBIDDEN_PATTERN.search(output)
+    if match:
+        matched = match.group().lower()
+        message = _REJECTION_MESSAGES.get((drag_mode, matched))
+        if message is None:
+            message = (
+                f"Prescriptive language detected in {drag_mode.value} mode: '{matched}'. "
+                f"Use neutral phrasing like: {_ALLOWED_HINT}"
             )
-    
+        return False, message
+
     return True, None
 
 
@@ -258,7 +378,14 @@ class AuditLogEntry(BaseModel):
     Logs are append-only and retained for 90 days minimum per OTS spec.
     """
     trace_id: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    # Stored as a raw Unix timestamp: datetime construction and isoformat
+    # are far costlier than time.time(), and most entries are only ever
+    # hashed, not displayed. ISO formatting happens lazily on dump.
+    # Rounded to microseconds so the hashed float and its ISO form carry
+    # the same information — entries re-read from disk must verify.
+    timestamp: float = Field(
+        default_factory=lambda: int(time.time() * 1_000_000) / 1_000_000
+    )
     aim: Dict[str, Any]
     drag_mode: str
     workflow_name: str
@@ -267,16 +394,63 @@ class AuditLogEntry(BaseModel):
     error: Optional[str] = None
     duration_seconds: Optional[float] = None
     integrity_hash: Optional[str] = None
-    
+
+    @field_validator('timestamp', mode='before')
+    @classmethod
+    def _parse_timestamp(cls, value):
+        """Accept the serialized ISO 8601 form back as Unix time"""
+        if isinstance(value, str):
+            parsed = datetime.fromisoformat(value)
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.timestamp()
+        return value
+
+    @field_serializer('timestamp')
+    def _serialize_timestamp(self, value: float) -> str:
+        """Format the stored Unix time as ISO 8601 only when serialized"""
+        return datetime.fromtimestamp(value, tz=timezone.utc).isoformat()
+
+    def _hash_payload(self) -> Dict[str, Any]:
+        """
+        Hash payload assembled by direct attribute reads.
+
+        Covers every field except integrity_hash itself; skipping
+        .dict(exclude=...) avoids a full Pydantic traversal per hash.
+        """
+        return {
+            'trace_id': self.trace_id,
+            'timestamp': self.timestamp,
+            'aim': self.aim,
+            'drag_mode': self.drag_mode,
+            'workflow_name': self.workflow_name,
+            'parameters': self.parameters,
+            'outcome': self.outcome,
+            'error': self.error,
+            'duration_seconds': self.duration_seconds
+        }
+
     def compute_integrity_hash(self) -> str:
         """
         Generate SHA-256 hash of log entry for tamper detection.
-        
-        Hash includes all fields except integrity_hash itself.
+
+        Hash includes all fields except integrity_hash itself. Each
+        top-level field is serialized by orjson (sorted keys, bytes
+        output, native datetimes) and fed to a rolling SHA-256, so large
+        parameter payloads never materialize as one monolithic document
+        and no second str-to-bytes copy is made.
         """
-        log_data = self.dict(exclude={'integrity_hash'})
-        log_json = json.dumps(log_data, sort_keys=True, default=str)
-        return hashlib.sha256(log_json.encode()).hexdigest()
+        hasher = hashlib.sha256()
+        for key, value in self._hash_payload().items():
+            hasher.update(key.encode())
+            hasher.update(b'\x00')
+            hasher.update(orjson.dumps(
+                value,
+                default=str,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC
+            ))
+            hasher.update(b'\n')
+        return hasher.hexdigest()
     
     def finalize(self):
         """Compute and set integrity hash"""
@@ -288,11 +462,6 @@ class AuditLogEntry(BaseModel):
             return False
         expected_hash = self.compute_integrity_hash()
         return expected_hash == self.integrity_hash
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 # ============================================================================
@@ -302,46 +471,21 @@ class AuditLogEntry(BaseModel):
 def validate_governance_request(request: GovernanceRequest) -> tuple[bool, Optional[str]]:
     """
     Validate complete governance request before workflow execution.
-    
-    Checks:
-    1. AIM declaration is complete
-    2. Actor is named and accountable
-    3. Input sources are specified
-    4. Mission has success criteria
-    5. DRAG mode is appropriate
-    
+
+    Every business rule is enforced at model construction time — field
+    constraints (min_length on the objective, sources and success
+    criteria) plus the Actor.name and drag_mode validators — so a
+    constructed GovernanceRequest is already valid. This hook is kept as
+    the extension point for future rules that can't be expressed on a
+    single field (e.g. cross-field policy checks).
+
     Args:
         request: GovernanceRequest to validate
-        
+
     Returns:
         Tuple of (is_valid, error_message)
     """
-    try:
-        # Pydantic will validate structure, but we add business rules
-        
-        # Check actor accountability
-        if not request.aim.actor.name or len(request.aim.actor.name.strip()) < 3:
-            return False, "Actor name must be at least 3 characters (real person required)"
-        
-        # Check input sources
-        if not request.aim.input.sources:
-            return False, "At least one input source required to constrain AI behavior"
-        
-        # Check mission clarity
-        if len(request.aim.mission.objective) < 10:
-            return False, "Mission objective too vague (minimum 10 characters)"
-        
-        if not request.aim.mission.success_criteria:
-            return False, "Mission must have at least one success criterion"
-        
-        # DRAG mode check (already validated by pydantic, but double-check)
-        if request.drag_mode not in [DRAGMode.DRAFT, DRAGMode.RESEARCH, DRAGMode.GRUNT, DRAGMode.EXECUTE]:
-            return False, "Invalid DRAG mode. Analysis is human-only."
-        
-        return True, None
-        
-    except Exception as e:
-        return False, f"Validation error: {str(e)}"
+    return True, None
 
 
 # ============================================================================
@@ -360,10 +504,22 @@ def generate_governance_summary(request: GovernanceRequest) -> str:
         - Input Sources: 1 (slack_webhook)
         - Success Criteria: 3
     """
+    # Bind the nested models once instead of re-walking the attribute
+    # chain for every placeholder
+    actor = request.aim.actor
+    mission = request.aim.mission
+    aim_input = request.aim.input
+
+    objective = mission.objective
+    if len(objective) > 80:
+        objective = objective[:80] + '...'
+
+    source_types = ', '.join([s.type for s in aim_input.sources[:3]])
+
     return f"""Governance Context:
-- Actor: {request.aim.actor.name} ({request.aim.actor.role})
-- Mission: {request.aim.mission.objective[:80]}{'...' if len(request.aim.mission.objective) > 80 else ''}
+- Actor: {actor.name} ({actor.role})
+- Mission: {objective}
 - DRAG Mode: {request.drag_mode.value.upper()}
-- Input Sources: {len(request.aim.input.sources)} ({', '.join(s.type for s in request.aim.input.sources[:3])})
-- Success Criteria: {len(request.aim.mission.success_criteria)}
-- Constraints: {len(request.aim.input.constraints)}"""
+- Input Sources: {len(aim_input.sources)} ({source_types})
+- Success Criteria: {len(mission.success_criteria)}
+- Constraints: {len(aim_input.constraints)}"""
@@ -15,9 +15,15 @@ Metrics Categories:
 """
 
 from prometheus_client import Counter, Histogram, Gauge, Info, generate_latest, REGISTRY
+from functools import lru_cache
 from typing import Optional
+import os
+import threading
 import time
 
+# Prometheus text exposition content type
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
 # ============================================================================
 # GOVERNANCE METRICS (AIM-DRAG Compliance)
 # ============================================================================
@@ -136,6 +142,75 @@ app_info.info({
     'compliance_spec': 'OTS-v0.1.0-alpha'
 })
 
+# ============================================================================
+# LABEL CHILD CACHES
+# ============================================================================
+
+# .labels() builds a kwargs dict, hashes the value tuple and takes the
+# metric's internal lock on every call. The record_* helpers below go
+# through these memoized getters instead, so repeat label combinations
+# resolve to the already-bound child.
+
+@lru_cache(maxsize=1024)
+def _aim_request_child(drag_mode: str, actor_role: str, workflow_name: str):
+    return aim_requests_total.labels(drag_mode, actor_role, workflow_name)
+
+
+@lru_cache(maxsize=256)
+def _aim_validation_failure_child(failure_reason: str, drag_mode: str):
+    return aim_validation_failures_total.labels(failure_reason, drag_mode)
+
+
+@lru_cache(maxsize=1024)
+def _workflow_execution_child(workflow_name: str, outcome: str):
+    return workflow_executions_total.labels(workflow_name, outcome)
+
+
+@lru_cache(maxsize=1024)
+def _governed_duration_child(workflow_name: str, outcome: str, drag_mode: str):
+    return governed_workflow_duration_seconds.labels(workflow_name, outcome, drag_mode)
+
+
+@lru_cache(maxsize=64)
+def _audit_log_entry_child(outcome: str, drag_mode: str):
+    return audit_log_entries_total.labels(outcome, drag_mode)
+
+
+@lru_cache(maxsize=256)
+def _prescriptive_detection_child(drag_mode: str, phrase_type: str):
+    return prescriptive_language_detections_total.labels(drag_mode, phrase_type)
+
+
+@lru_cache(maxsize=1024)
+def _http_request_child(method: str, endpoint: str, status_code: str):
+    return http_requests_total.labels(method, endpoint, status_code)
+
+
+@lru_cache(maxsize=512)
+def _http_duration_child(method: str, endpoint: str):
+    return http_request_duration_seconds.labels(method, endpoint)
+
+
+# Bounded-cardinality children bound at import: these label sets are fixed
+# by the code, so the hot record path is a direct .inc() on the child with
+# no lookup at all. Unknown values (future label additions) fall back to
+# .labels() in the helpers.
+_jwt_children = {
+    'success': jwt_validations_total.labels('success'),
+    'failure': jwt_validations_total.labels('failure'),
+}
+
+_slack_verification_children = {
+    'success': slack_signature_verifications_total.labels('success'),
+    'failure': slack_signature_verifications_total.labels('failure'),
+}
+
+_auth_failure_children = {
+    'missing_token': authentication_failures_total.labels('missing_token'),
+    'invalid_token': authentication_failures_total.labels('invalid_token'),
+}
+
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
@@ -159,19 +234,12 @@ class MetricsTimer:
 
 def record_aim_request(drag_mode: str, actor_role: str, workflow_name: str):
     """Record an AIM-declared governance request"""
-    aim_requests_total.labels(
-        drag_mode=drag_mode,
-        actor_role=actor_role,
-        workflow_name=workflow_name
-    ).inc()
+    _aim_request_child(drag_mode, actor_role, workflow_name).inc()
 
 
 def record_aim_validation_failure(failure_reason: str, drag_mode: str):
     """Record an AIM validation failure"""
-    aim_validation_failures_total.labels(
-        failure_reason=failure_reason,
-        drag_mode=drag_mode
-    ).inc()
+    _aim_validation_failure_child(failure_reason, drag_mode).inc()
 
 
 def record_workflow_execution(
@@ -182,34 +250,21 @@ def record_workflow_execution(
 ):
     """Record workflow execution metrics"""
     # Record general workflow execution
-    workflow_executions_total.labels(
-        workflow_name=workflow_name,
-        outcome=outcome
-    ).inc()
-    
+    _workflow_execution_child(workflow_name, outcome).inc()
+
     # Record governed workflow metrics if AIM-DRAG was used
     if drag_mode:
-        governed_workflow_duration_seconds.labels(
-            workflow_name=workflow_name,
-            outcome=outcome,
-            drag_mode=drag_mode
-        ).observe(duration_seconds)
+        _governed_duration_child(workflow_name, outcome, drag_mode).observe(duration_seconds)
 
 
 def record_audit_log_entry(outcome: str, drag_mode: str):
     """Record audit log entry written"""
-    audit_log_entries_total.labels(
-        outcome=outcome,
-        drag_mode=drag_mode
-    ).inc()
+    _audit_log_entry_child(outcome, drag_mode).inc()
 
 
 def record_prescriptive_language_detection(drag_mode: str, phrase_type: str):
     """Record prescriptive language filter detection"""
-    prescriptive_language_detections_total.labels(
-        drag_mode=drag_mode,
-        phrase_type=phrase_type
-    ).inc()
+    _prescriptive_detection_child(drag_mode, phrase_type).inc()
 
 
 def record_slack_event(event_type: str):
@@ -219,33 +274,55 @@ def record_slack_event(event_type: str):
 
 def record_slack_verification(outcome: str):
     """Record Slack signature verification"""
-    slack_signature_verifications_total.labels(outcome=outcome).inc()
+    child = _slack_verification_children.get(outcome)
+    if child is None:
+        child = slack_signature_verifications_total.labels(outcome)
+    child.inc()
 
 
 def record_jwt_validation(outcome: str):
     """Record JWT validation"""
-    jwt_validations_total.labels(outcome=outcome).inc()
+    child = _jwt_children.get(outcome)
+    if child is None:
+        child = jwt_validations_total.labels(outcome)
+    child.inc()
 
 
 def record_authentication_failure(failure_type: str):
     """Record authentication failure"""
-    authentication_failures_total.labels(failure_type=failure_type).inc()
+    child = _auth_failure_children.get(failure_type)
+    if child is None:
+        child = authentication_failures_total.labels(failure_type)
+    child.inc()
 
 
 def record_http_request(method: str, endpoint: str, status_code: int, duration: float):
     """Record HTTP request metrics"""
-    http_requests_total.labels(
-        method=method,
-        endpoint=endpoint,
-        status_code=str(status_code)
-    ).inc()
-    
-    http_request_duration_seconds.labels(
-        method=method,
-        endpoint=endpoint
-    ).observe(duration)
+    _http_request_child(method, endpoint, str(status_code)).inc()
+    _http_duration_child(method, endpoint).observe(duration)
+
+
+# Rendered exposition cache: generate_latest walks every label child in
+# REGISTRY per call, so concurrent scrapers share one snapshot per TTL
+# window instead of each paying the full serialization.
+METRICS_CACHE_TTL = float(os.getenv('METRICS_CACHE_TTL', '1'))
+
+_metrics_cache_lock = threading.Lock()
+_metrics_cache: Optional[tuple] = None  # (monotonic expiry, rendered bytes)
 
 
 def get_metrics_text() -> bytes:
-    """Get Prometheus metrics in text format"""
-    return generate_latest(REGISTRY)
+    """Get Prometheus metrics in text format, cached for METRICS_CACHE_TTL"""
+    global _metrics_cache
+    now = time.monotonic()
+    cached = _metrics_cache
+    if cached is not None and now < cached[0]:
+        return cached[1]
+
+    with _metrics_cache_lock:
+        cached = _metrics_cache
+        if cached is not None and now < cached[0]:
+            return cached[1]
+        rendered = generate_latest(REGISTRY)
+        _metrics_cache = (time.monotonic() + METRICS_CACHE_TTL, rendered)
+        return rendered
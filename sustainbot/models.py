@@ -2,7 +2,9 @@
 
 import os
 import logging
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional, List, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -16,50 +18,101 @@ class LLMInterface:
         self.host = host
         self.port = port
         self.api_url = f"http://{host}:{port}"
-        self.timeout = 30
+        # (connect, read): a dead backend fails in ~3s instead of holding
+        # the worker thread for the full read timeout
+        self.timeout = (3.05, 30)
+
+        # Pooled session: keep-alive reuses the Ollama connection across
+        # calls instead of a fresh TCP handshake per request
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_maxsize=32))
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
 
     def health_check(self) -> bool:
         """Check if LLM service is available"""
         try:
-            response = requests.get(f"{self.api_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.api_url}/api/tags", timeout=(3.05, 5))
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
 
-    def generate(self, prompt: str, **kwargs) -> Optional[str]:
-        """Generate text using the LLM"""
+    def generate_stream(self, prompt: str, **kwargs):
+        """
+        Generate text using the LLM, yielding chunks as Ollama emits them.
+
+        First-token latency is one token's generation time instead of the
+        whole response, and peak memory stays at one NDJSON line. Suitable
+        for wiring straight into a streaming Response.
+        """
         try:
-            payload = {"model": self.model, "prompt": prompt, "stream": False, **kwargs}
-            response = requests.post(f"{self.api_url}/api/generate", json=payload, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                return response.json().get('response', '')
-            else:
-                logger.error(f"LLM error: {response.status_code}")
-                return None
+            payload = {"model": self.model, "prompt": prompt, "stream": True, **kwargs}
+            with self.session.post(
+                f"{self.api_url}/api/generate",
+                json=payload,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"LLM error: {response.status_code}")
+                    return
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    piece = chunk.get('response', '')
+                    if piece:
+                        yield piece
+                    if chunk.get('done'):
+                        break
         except requests.exceptions.RequestException as e:
             logger.error(f"Error connecting to LLM: {e}")
+
+    def generate(self, prompt: str, **kwargs) -> Optional[str]:
+        """Generate text using the LLM, buffered into one string"""
+        pieces = list(self.generate_stream(prompt, **kwargs))
+        if not pieces:
             return None
+        return ''.join(pieces)
 
-    def chat(self, messages: List[Dict[str, str]]) -> Optional[str]:
-        """Chat interface for multi-turn conversations"""
+    def chat_stream(self, messages: List[Dict[str, str]]):
+        """Chat interface yielding content chunks as Ollama emits them"""
         try:
-            payload = {"model": self.model, "messages": messages, "stream": False}
-            response = requests.post(f"{self.api_url}/api/chat", json=payload, timeout=self.timeout)
-            
-            if response.status_code == 200:
-                return response.json().get('message', {}).get('content', '')
-            else:
-                logger.error(f"Chat error: {response.status_code}")
-                return None
+            payload = {"model": self.model, "messages": messages, "stream": True}
+            with self.session.post(
+                f"{self.api_url}/api/chat",
+                json=payload,
+                timeout=self.timeout,
+                stream=True
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"Chat error: {response.status_code}")
+                    return
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = orjson.loads(line)
+                    piece = chunk.get('message', {}).get('content', '')
+                    if piece:
+                        yield piece
+                    if chunk.get('done'):
+                        break
         except requests.exceptions.RequestException as e:
             logger.error(f"Error in chat: {e}")
+
+    def chat(self, messages: List[Dict[str, str]]) -> Optional[str]:
+        """Chat interface for multi-turn conversations, buffered"""
+        pieces = list(self.chat_stream(messages))
+        if not pieces:
             return None
+        return ''.join(pieces)
 
     def list_models(self) -> List[str]:
         """List available models"""
         try:
-            response = requests.get(f"{self.api_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.api_url}/api/tags", timeout=(3.05, 5))
             if response.status_code == 200:
                 models = response.json().get('models', [])
                 return [m.get('name', '') for m in models]
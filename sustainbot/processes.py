@@ -1,15 +1,36 @@
 """Workflow orchestration for SustainBot"""
 
+import itertools
 import os
-import json
 import logging
+import orjson
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional
 from pathlib import Path
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Per-second ISO timestamp cache: executions in the same second reuse the
+# formatted string instead of allocating a datetime + isoformat each
+_iso_cache = (0, '')
+
+# Monotonic sequence keeping execution ids unique within a second
+_execution_counter = itertools.count()
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as ISO 8601, cached at one-second granularity"""
+    global _iso_cache
+    seconds = int(time.time())
+    cached_seconds, rendered = _iso_cache
+    if seconds != cached_seconds:
+        rendered = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _iso_cache = (seconds, rendered)
+    return rendered
+
 
 class WorkflowEngine:
     """Orchestrates workflow execution via OpenClaw"""
@@ -18,16 +39,37 @@ class WorkflowEngine:
         self.openclaw_url = openclaw_url
         self.workflows_dir = workflows_dir
         self.workflows: Dict[str, Dict[str, Any]] = {}
-        self.timeout = 30
+        # File mtimes from the last load; unchanged files skip re-parsing
+        self._mtime_cache: Dict[Path, float] = {}
+        # Rendered /workflows response; rebuilt only when the registry changes
+        self._list_response_cache: Optional[bytes] = None
+        # (connect, read): a dead OpenClaw fails in ~3s instead of holding
+        # the worker thread for the full read timeout
+        self.timeout = (3.05, 30)
+
+        # Pooled session: keep-alive reuses the OpenClaw connection across
+        # health checks and submissions instead of a handshake per call
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_maxsize=32))
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
 
     def health_check(self) -> bool:
         """Check if OpenClaw is available"""
         try:
-            response = requests.get(f"{self.openclaw_url}/health", timeout=5)
+            response = self.session.get(f"{self.openclaw_url}/health", timeout=(3.05, 5))
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
 
+    @staticmethod
+    def _read_workflow(workflow_file: Path):
+        """Read and parse one workflow file (runs on the loader pool)"""
+        with open(workflow_file, 'rb') as f:
+            return orjson.loads(f.read())
+
     def load_workflows(self) -> bool:
         """Load workflow definitions from disk"""
         try:
@@ -36,15 +78,34 @@ class WorkflowEngine:
                 logger.warning(f"Workflows directory not found: {self.workflows_dir}")
                 return False
 
+            # Stat everything first, then read the changed files on a small
+            # thread pool so the open/read syscalls overlap instead of
+            # running serially (a real win on networked storage)
+            stale = []
             for workflow_file in workflows_path.glob('*.json'):
-                try:
-                    with open(workflow_file, 'r') as f:
-                        workflow = json.load(f)
-                        workflow_name = workflow_file.stem
-                        self.workflows[workflow_name] = workflow
-                        logger.info(f"Loaded workflow: {workflow_name}")
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON in {workflow_file}: {e}")
+                mtime = workflow_file.stat().st_mtime
+                if self._mtime_cache.get(workflow_file) != mtime:
+                    stale.append((workflow_file, mtime))
+
+            if not stale:
+                return True
+
+            with ThreadPoolExecutor(max_workers=min(8, len(stale))) as pool:
+                futures = [pool.submit(self._read_workflow, f) for f, _ in stale]
+                for (workflow_file, mtime), future in zip(stale, futures):
+                    try:
+                        workflow = future.result()
+                    except orjson.JSONDecodeError as e:
+                        logger.error(f"Invalid JSON in {workflow_file}: {e}")
+                        continue
+                    except OSError as e:
+                        logger.error(f"Error reading {workflow_file}: {e}")
+                        continue
+                    workflow_name = workflow_file.stem
+                    self.workflows[workflow_name] = workflow
+                    self._mtime_cache[workflow_file] = mtime
+                    self._list_response_cache = None
+                    logger.info(f"Loaded workflow: {workflow_name}")
 
             return True
         except Exception as e:
@@ -59,14 +120,38 @@ class WorkflowEngine:
         """List all available workflows"""
         return list(self.workflows.keys())
 
+    def list_workflows_response(self) -> bytes:
+        """
+        Rendered JSON body for the /workflows endpoint.
+
+        The registry only changes in load_workflows, so the serialized
+        bytes are cached until then and dashboards polling the list get a
+        straight buffer copy.
+        """
+        cached = self._list_response_cache
+        if cached is None:
+            workflows = list(self.workflows.keys())
+            cached = orjson.dumps({"workflows": workflows, "count": len(workflows)})
+            self._list_response_cache = cached
+        return cached
+
     def execute(self, workflow_name: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Execute a workflow via OpenClaw"""
+        """
+        Execute a workflow via OpenClaw.
+
+        Submissions are deliberately not batched: OpenClaw's execute API
+        accepts one workflow per POST and execution never touches the
+        LLM, so coalescing bursts would add queueing latency without
+        saving any round-trips. Revisit if OpenClaw grows a bulk-submit
+        endpoint.
+        """
         if not self.has_workflow(workflow_name):
             return {"success": False, "error": f"Workflow not found: {workflow_name}"}
 
         try:
             workflow = self.workflows[workflow_name]
-            execution_id = f"{workflow_name}_{datetime.utcnow().isoformat()}"
+            # Counter suffix keeps ids unique within the cached second
+            execution_id = f"{workflow_name}_{_utcnow_iso()}_{next(_execution_counter)}"
 
             payload = {
                 "workflow": workflow,
@@ -74,9 +159,11 @@ class WorkflowEngine:
                 "execution_id": execution_id
             }
 
-            # If OpenClaw is available, submit to it
-            if self.health_check():
-                response = requests.post(
+            # Submit to OpenClaw directly — the POST itself tells us whether
+            # it's up, so a pre-flight health_check GET per execution just
+            # doubled the round-trips
+            try:
+                response = self.session.post(
                     f"{self.openclaw_url}/api/workflows/execute",
                     json=payload,
                     timeout=self.timeout
@@ -88,12 +175,12 @@ class WorkflowEngine:
                         "execution_id": execution_id,
                         "workflow": workflow_name,
                         "status": "submitted",
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": _utcnow_iso()
                     }
                 else:
                     logger.error(f"OpenClaw error: {response.status_code}")
                     return {"success": False, "error": f"OpenClaw error: {response.status_code}"}
-            else:
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
                 # Local execution if OpenClaw not available
                 logger.info(f"Executing workflow locally: {workflow_name}")
                 return {
@@ -102,7 +189,7 @@ class WorkflowEngine:
                     "workflow": workflow_name,
                     "status": "executed",
                     "mode": "local",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": _utcnow_iso()
                 }
         except Exception as e:
             logger.error(f"Error executing workflow: {e}")
@@ -22,47 +22,67 @@ Log Format:
 }
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import queue
+import time
 from datetime import datetime
 from typing import Any, Dict
 from pythonjsonlogger import jsonlogger
 
+# Cache of (whole seconds, formatted prefix): consecutive records usually
+# land in the same second, so only the microsecond suffix needs formatting
+# per line instead of a fresh datetime + isoformat call.
+_ts_prefix_cache = (0, '')
+
+
+def _iso_timestamp(created: float) -> str:
+    """Format a logging timestamp (record.created) as ISO 8601 UTC"""
+    global _ts_prefix_cache
+    seconds = int(created)
+    cached_seconds, prefix = _ts_prefix_cache
+    if seconds != cached_seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _ts_prefix_cache = (seconds, prefix)
+    return f"{prefix}.{int((created - seconds) * 1_000_000):06d}Z"
+
+
+# Governance context attributes attached via logging's extra= mechanism
+_EXTRA_FIELDS = (
+    'trace_id',
+    'actor',
+    'drag_mode',
+    'workflow_name',
+    'outcome',
+    'duration_seconds',
+)
+
 
 class GovernanceJsonFormatter(jsonlogger.JsonFormatter):
     """Custom JSON formatter with governance context"""
-    
+
     def add_fields(self, log_record: Dict[str, Any], record: logging.LogRecord, message_dict: Dict[str, Any]):
         """Add custom fields to log record"""
         super().add_fields(log_record, record, message_dict)
-        
-        # Add timestamp in ISO format
-        log_record['timestamp'] = datetime.utcnow().isoformat() + 'Z'
-        
+
+        # Add timestamp in ISO format, reusing the record's own created time
+        log_record['timestamp'] = _iso_timestamp(record.created)
+
         # Add level name
         log_record['level'] = record.levelname
-        
+
         # Add logger name
         log_record['logger'] = record.name
-        
-        # Add governance context if available
-        if hasattr(record, 'trace_id'):
-            log_record['trace_id'] = record.trace_id
-        
-        if hasattr(record, 'actor'):
-            log_record['actor'] = record.actor
-        
-        if hasattr(record, 'drag_mode'):
-            log_record['drag_mode'] = record.drag_mode
-        
-        if hasattr(record, 'workflow_name'):
-            log_record['workflow_name'] = record.workflow_name
-        
-        if hasattr(record, 'outcome'):
-            log_record['outcome'] = record.outcome
-        
-        if hasattr(record, 'duration_seconds'):
-            log_record['duration_seconds'] = record.duration_seconds
+
+        # Add governance context if available. record.__dict__.get skips
+        # hasattr's try/except-based attribute probe per field.
+        record_dict = record.__dict__
+        for field in _EXTRA_FIELDS:
+            value = record_dict.get(field)
+            if value is not None:
+                log_record[field] = value
 
 
 def configure_json_logging(log_file: str = './logs/sustainbot.jsonl', level: int = logging.INFO):
@@ -83,25 +103,37 @@ def configure_json_logging(log_file: str = './logs/sustainbot.jsonl', level: int
     formatter = GovernanceJsonFormatter(
         '%(timestamp)s %(level)s %(logger)s %(message)s'
     )
-    
+
     # File handler for JSON logs
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(formatter)
     file_handler.setLevel(level)
-    
+
     # Console handler for human-readable logs (keep for development)
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     ))
     console_handler.setLevel(level)
-    
+
+    # Decouple emit from write: callers only enqueue the record; a
+    # QueueListener thread does the formatting and disk/console I/O, so
+    # hot paths never block on a flush
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
-    
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
     return root_logger
 
 